@@ -3,6 +3,7 @@
 
 """Provide the Databases class to handle database relations and state."""
 
+import functools
 import logging
 import pathlib
 import typing
@@ -18,6 +19,24 @@ from flask_app import FlaskApp
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _supported_db_relation_names() -> tuple[str, ...]:
+    """List the database relation names the charm supports according to metadata.yaml.
+
+    The metadata file is immutable for the lifetime of the charm process, so the parsed
+    result is cached to avoid re-reading and re-parsing it on every charm initialization.
+
+    Returns:
+        The supported database relation names declared in metadata.yaml.
+    """
+    metadata = yaml.safe_load(pathlib.Path("metadata.yaml").read_text(encoding="utf-8"))
+    return tuple(
+        FLASK_SUPPORTED_DB_INTERFACES[require["interface"]]
+        for require in metadata["requires"].values()
+        if require["interface"] in FLASK_SUPPORTED_DB_INTERFACES
+    )
+
+
 def make_database_requirers(charm: ops.CharmBase) -> typing.Dict[str, DatabaseRequires]:
     """Create database requirer objects for the charm.
 
@@ -27,12 +46,7 @@ def make_database_requirers(charm: ops.CharmBase) -> typing.Dict[str, DatabaseRe
     Returns: A dictionary which is the database uri environment variable name and the
         value is the corresponding database requirer object.
     """
-    metadata = yaml.safe_load(pathlib.Path("metadata.yaml").read_text(encoding="utf-8"))
-    db_interfaces = (
-        FLASK_SUPPORTED_DB_INTERFACES[require["interface"]]
-        for require in metadata["requires"].values()
-        if require["interface"] in FLASK_SUPPORTED_DB_INTERFACES
-    )
+    db_interfaces = _supported_db_relation_names()
     # automatically create database relation requirers to manage database relations
     # one database relation requirer is required for each of the database relations
     # create a dictionary to hold the requirers
@@ -70,12 +84,13 @@ def get_uris(database_requirers: typing.Dict[str, DatabaseRequires]) -> typing.D
 
         # Check that the relation data is well formed according to the following json_schema:
         # https://github.com/canonical/charm-relation-interfaces/blob/main/interfaces/mysql_client/v0/schemas/provider.json
-        if not all(data.get(key) for key in ("endpoints", "username", "password")):
+        if not (data.get("endpoints") and data.get("username") and data.get("password")):
             logger.warning("Incorrect relation data from the data provider: %s", data)
             continue
 
         database_name = data.get("database", db_requires.database)
-        endpoint = data["endpoints"].split(",")[0]
+        # partition stops at the first comma instead of splitting the whole string
+        endpoint = data["endpoints"].partition(",")[0]
         db_uris[f"{interface_name.upper()}_DB_CONNECT_STRING"] = (
             f"{interface_name}://"
             f"{data['username']}:{data['password']}"
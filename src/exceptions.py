@@ -4,21 +4,32 @@
 """Exceptions used by the Flask charm."""
 
 
-class CharmConfigInvalidError(Exception):
-    """Exception raised when a charm configuration is found to be invalid.
+class _MsgError(Exception):
+    """Base class for exceptions that carry an explanation message.
 
     Attrs:
         msg (str): Explanation of the error.
     """
 
+    __slots__ = ("msg",)
+
     def __init__(self, msg: str):
-        """Initialize a new instance of the CharmConfigInvalidError exception.
+        """Initialize a new instance of the exception.
 
         Args:
             msg (str): Explanation of the error.
         """
+        super().__init__(msg)
         self.msg = msg
 
 
+class CharmConfigInvalidError(_MsgError):
+    """Exception raised when a charm configuration is found to be invalid.
+
+    Attrs:
+        msg (str): Explanation of the error.
+    """
+
+
 class PebbleNotReadyError(Exception):
     """Exception raised when accessing pebble while it isn't ready."""
@@ -2,6 +2,8 @@
 # See LICENSE file for licensing details.
 
 """Provide the FlaskApp class to represent the Flask application."""
+import functools
+import itertools
 import json
 import logging
 import shlex
@@ -16,10 +18,32 @@ from webserver import GunicornWebserver
 
 logger = logging.getLogger(__name__)
 
+_BUILTIN_FLASK_CONFIG = frozenset(
+    c.removeprefix("flask_") for c in KNOWN_CHARM_CONFIG if c.startswith("flask_")
+)
+
+# reuse one encoder instead of paying the json.dumps setup cost per config value
+_json_encode = json.JSONEncoder().encode
+
+
+@functools.lru_cache(maxsize=8)
+def _join_command(command: tuple[str, ...]) -> str:
+    """Shell-quote and join a command line, caching the result for identical commands.
+
+    Args:
+        command: the command line to join.
+
+    Returns:
+        The shell-quoted command line string.
+    """
+    return shlex.join(command)
+
 
 class FlaskApp:  # pylint: disable=too-few-public-methods
     """Flask application manager."""
 
+    __slots__ = ("_charm", "_charm_state", "_webserver", "_database_migration", "_env_cache")
+
     def __init__(
         self,
         charm: ops.CharmBase,
@@ -39,10 +63,14 @@ class FlaskApp:  # pylint: disable=too-few-public-methods
         self._charm_state = charm_state
         self._webserver = webserver
         self._database_migration = database_migration
+        self._env_cache: dict[str, str] | None = None
 
     def _flask_environment(self) -> dict[str, str]:
         """Generate a Flask environment dictionary from the charm Flask configurations.
 
+        The result is cached on the instance since the charm state it derives from is fixed
+        for the lifetime of the FlaskApp object.
+
         The Flask environment generation follows these rules:
             1. User-defined configuration cannot overwrite built-in Flask configurations, even if
                 the built-in Flask configuration value is None (undefined).
@@ -54,41 +82,59 @@ class FlaskApp:  # pylint: disable=too-few-public-methods
         Returns:
             A dictionary representing the Flask environment variables.
         """
-        builtin_flask_config = [
-            c.removeprefix("flask_") for c in KNOWN_CHARM_CONFIG if c.startswith("flask_")
-        ]
-        flask_env = {
-            k: v for k, v in self._charm_state.app_config.items() if k not in builtin_flask_config
-        }
-        flask_env.update(self._charm_state.flask_config)
-        env = {
-            f"{FLASK_ENV_CONFIG_PREFIX}{k.upper()}": v if isinstance(v, str) else json.dumps(v)
-            for k, v in flask_env.items()
-        }
+        if self._env_cache is not None:
+            return self._env_cache
+        charm_state = self._charm_state
+        str_items: dict[str, str] = {}
+        other_items: dict[str, int | str | bool] = {}
+        for k, v in itertools.chain(
+            (
+                (k, v)
+                for k, v in charm_state.app_config.items()
+                if k not in _BUILTIN_FLASK_CONFIG
+            ),
+            charm_state.flask_config.items(),
+        ):
+            # exact type check: config values are plain builtins and this avoids the
+            # isinstance MRO walk on the common all-string path
+            # pylint: disable-next=unidiomatic-typecheck
+            if type(v) is str:
+                str_items[k] = v
+            else:
+                other_items[k] = v
+        env = {f"{FLASK_ENV_CONFIG_PREFIX}{k.upper()}": v for k, v in str_items.items()}
+        env.update(
+            (f"{FLASK_ENV_CONFIG_PREFIX}{k.upper()}", _json_encode(v))
+            for k, v in other_items.items()
+        )
         secret_key_env = f"{FLASK_ENV_CONFIG_PREFIX}SECRET_KEY"
         if secret_key_env not in env:
-            env[secret_key_env] = self._charm_state.flask_secret_key
+            env[secret_key_env] = charm_state.flask_secret_key
+        proxy = charm_state.proxy
         for proxy_variable in ("http_proxy", "https_proxy", "no_proxy"):
-            proxy_value = getattr(self._charm_state.proxy, proxy_variable)
+            proxy_value = getattr(proxy, proxy_variable)
             if proxy_value:
                 env[proxy_variable] = str(proxy_value)
                 env[proxy_variable.upper()] = str(proxy_value)
-        env.update(self._charm_state.database_uris)
+        env.update(charm_state.database_uris)
+        self._env_cache = env
         return env
 
-    def _flask_layer(self) -> ops.pebble.LayerDict:
+    def _flask_layer(self, environment: dict[str, str]) -> ops.pebble.LayerDict:
         """Generate the pebble layer definition for flask application.
 
+        Args:
+            environment: the Flask environment variables for the flask application service.
+
         Returns:
             The pebble layer definition for flask application.
         """
-        environment = self._flask_environment()
         return ops.pebble.LayerDict(
             services={
                 FLASK_SERVICE_NAME: {
                     "override": "replace",
                     "summary": "Flask application service",
-                    "command": shlex.join(self._webserver.command),
+                    "command": _join_command(tuple(self._webserver.command)),
                     "startup": "enabled",
                     "environment": environment,
                 }
@@ -108,13 +154,14 @@ class FlaskApp:  # pylint: disable=too-few-public-methods
         if not self._charm_state.is_secret_storage_ready:
             logger.info("secret storage is not initialized")
             return
-        container.add_layer("flask", self._flask_layer(), combine=True)
+        environment = self._flask_environment()
+        container.add_layer("flask", self._flask_layer(environment), combine=True)
         is_webserver_running = container.get_service(FLASK_SERVICE_NAME).is_running()
         self._webserver.update_config(
-            flask_environment=self._flask_environment(),
+            flask_environment=environment,
             is_webserver_running=is_webserver_running,
         )
-        self._database_migration.run(self._flask_environment())
+        self._database_migration.run(environment)
         container.replan()
         if (
             self._database_migration.get_completed_script() is not None
@@ -13,6 +13,43 @@ from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
 from charm_state import CharmState
 from constants import FLASK_CONTAINER_NAME
 
+# evaluated once at import time so the pebble-ready handler doesn't re-run dedent
+# and rebuild the layer dict on every event
+_STATSD_MAPPING_CONFIG = textwrap.dedent(
+    """\
+    mappings:
+      - match: gunicorn.request.status.*
+        name: flask_response_code
+        labels:
+          status: $1
+      - match: gunicorn.requests
+        name: flask_requests
+      - match: gunicorn.request.duration
+        name: flask_request_duration
+    """
+)
+
+_STATSD_EXPORTER_LAYER = ops.pebble.LayerDict(
+    summary="statsd exporter layer",
+    description="statsd exporter layer",
+    services={
+        "statsd-prometheus-exporter": {
+            "override": "replace",
+            "summary": "statsd exporter service",
+            "user": "nobody",
+            "command": "/bin/statsd_exporter --statsd.mapping-config=/statsd.conf",
+            "startup": "enabled",
+        }
+    },
+    checks={
+        "container-ready": {
+            "override": "replace",
+            "level": "ready",
+            "http": {"url": "http://localhost:9102/metrics"},
+        },
+    },
+)
+
 
 class Observability(ops.Object):  # pylint: disable=too-few-public-methods
     """A class representing the observability stack for Flask application."""
@@ -48,41 +85,6 @@ class Observability(ops.Object):  # pylint: disable=too-few-public-methods
     def _on_statsd_prometheus_exporter_pebble_ready(self, _event: ops.PebbleReadyEvent) -> None:
         """Handle the statsd-prometheus-exporter-pebble-ready event."""
         container = self._charm.unit.get_container("statsd-prometheus-exporter")
-        container.push(
-            "/statsd.conf",
-            textwrap.dedent(
-                """\
-                mappings:
-                  - match: gunicorn.request.status.*
-                    name: flask_response_code
-                    labels:
-                      status: $1
-                  - match: gunicorn.requests
-                    name: flask_requests
-                  - match: gunicorn.request.duration
-                    name: flask_request_duration
-                """
-            ),
-        )
-        statsd_layer = ops.pebble.LayerDict(
-            summary="statsd exporter layer",
-            description="statsd exporter layer",
-            services={
-                "statsd-prometheus-exporter": {
-                    "override": "replace",
-                    "summary": "statsd exporter service",
-                    "user": "nobody",
-                    "command": "/bin/statsd_exporter --statsd.mapping-config=/statsd.conf",
-                    "startup": "enabled",
-                }
-            },
-            checks={
-                "container-ready": {
-                    "override": "replace",
-                    "level": "ready",
-                    "http": {"url": "http://localhost:9102/metrics"},
-                },
-            },
-        )
-        container.add_layer("statsd-prometheus-exporter", statsd_layer, combine=True)
+        container.push("/statsd.conf", _STATSD_MAPPING_CONFIG)
+        container.add_layer("statsd-prometheus-exporter", _STATSD_EXPORTER_LAYER, combine=True)
         container.replan()
@@ -2,9 +2,10 @@
 # See LICENSE file for licensing details.
 
 """Provide the GunicornWebserver class to represent the gunicorn server."""
-import datetime
+import functools
+import hashlib
 import logging
-import pathlib
+import os.path
 import signal
 import typing
 
@@ -12,13 +13,18 @@ import ops
 from ops.pebble import ExecError, PathError
 
 from charm_state import CharmState
-from constants import FLASK_APP_DIR, FLASK_BASE_DIR, FLASK_SERVICE_NAME
+from constants import FLASK_APP_DIR, FLASK_BASE_DIR, FLASK_SERVICE_NAME, FLASK_STATE_DIR
 from exceptions import CharmConfigInvalidError
 
 logger = logging.getLogger(__name__)
 
+_FLASK_APP_DIR_REPR = repr(str(FLASK_APP_DIR))
 
-class GunicornWebserver:
+# fixed output order for the gunicorn settings derived from WebserverConfig
+_WEBSERVER_CONFIG_KEYS = ("workers", "threads", "keepalive", "timeout")
+
+
+class GunicornWebserver:  # pylint: disable=too-few-public-methods
     """A class representing a Gunicorn web server.
 
     Attrs:
@@ -26,6 +32,8 @@ class GunicornWebserver:
 
     """
 
+    _VALIDATED_CONFIG_FILE = FLASK_STATE_DIR / "validated-webserver-configs"
+
     def __init__(
         self,
         charm_state: CharmState,
@@ -39,68 +47,60 @@ class GunicornWebserver:
         """
         self._charm_state = charm_state
         self._flask_container = flask_container
+        self._prepared_log_dirs: set[str] = set()
+        self._config_path = FLASK_BASE_DIR / "gunicorn.conf.py"
+        self.command = [
+            "python3",
+            "-m",
+            "gunicorn",
+            "-c",
+            str(self._config_path),
+            "app:app",
+        ]
+        self._check_config_command = self.command + ["--check-config"]
 
-    @property
-    def _config(self) -> str:
-        """Generate the content of the Gunicorn configuration file based on charm states.
+    @functools.cached_property
+    def _access_log_str(self) -> str:
+        """Get the absolute path of the Flask access log as a string.
 
         Returns:
-            The content of the Gunicorn configuration file.
+            The absolute path of the Flask access log.
         """
-        config_entries = []
-        for setting, setting_value in self._charm_state.webserver_config.items():
-            setting_value = typing.cast(None | int | datetime.timedelta, setting_value)
-            if setting_value is None:
-                continue
-            setting_value = (
-                setting_value
-                if isinstance(setting_value, int)
-                else int(setting_value.total_seconds())
-            )
-            config_entries.append(f"{setting} = {setting_value}")
-        new_line = "\n"
-        config = f"""\
-bind = ['0.0.0.0:{self._charm_state.flask_port}']
-chdir = {repr(str(FLASK_APP_DIR))}
-accesslog = {repr(str(self._charm_state.flask_access_log.absolute()))}
-errorlog = {repr(str(self._charm_state.flask_error_log.absolute()))}
-statsd_host = {repr(self._charm_state.flask_statsd_host)}
-{new_line.join(config_entries)}"""
-        return config
+        return str(self._charm_state.flask_access_log.absolute())
 
-    @property
-    def _config_path(self) -> pathlib.Path:
-        """Gets the path to the Gunicorn configuration file.
+    @functools.cached_property
+    def _error_log_str(self) -> str:
+        """Get the absolute path of the Flask error log as a string.
 
         Returns:
-            The path to the web server configuration file.
+            The absolute path of the Flask error log.
         """
-        return FLASK_BASE_DIR / "gunicorn.conf.py"
+        return str(self._charm_state.flask_error_log.absolute())
 
-    @property
-    def command(self) -> list[str]:
-        """Get the command to start the Gunicorn web server.
+    @functools.cached_property
+    def _config(self) -> str:
+        """Generate the content of the Gunicorn configuration file based on charm states.
 
         Returns:
-            The command to start the Gunicorn web server.
+            The content of the Gunicorn configuration file.
         """
-        return [
-            "python3",
-            "-m",
-            "gunicorn",
-            "-c",
-            str(self._config_path),
-            "app:app",
+        charm_state = self._charm_state
+        webserver_config = charm_state.webserver_config
+        lines = [
+            f"bind = ['0.0.0.0:{charm_state.flask_port}']",
+            f"chdir = {_FLASK_APP_DIR_REPR}",
+            f"accesslog = {repr(self._access_log_str)}",
+            f"errorlog = {repr(self._error_log_str)}",
+            f"statsd_host = {repr(charm_state.flask_statsd_host)}",
         ]
-
-    @property
-    def _check_config_command(self) -> list[str]:
-        """Returns the command to check the Gunicorn configuration.
-
-        Returns:
-            The command to check the Gunicorn configuration.
-        """
-        return self.command + ["--check-config"]
+        for setting in _WEBSERVER_CONFIG_KEYS:
+            value = webserver_config.get(setting)
+            if value is None:
+                continue
+            # timedelta values expose total_seconds; plain ints are used as-is
+            total_seconds = getattr(value, "total_seconds", None)
+            lines.append(f"{setting} = {value if total_seconds is None else int(total_seconds())}")
+        return "\n".join(lines)
 
     @property
     def _reload_signal(self) -> signal.Signals:
@@ -122,37 +122,73 @@ statsd_host = {repr(self._charm_state.flask_statsd_host)}
             CharmConfigInvalidError: if the charm configuration is not valid.
         """
         self._prepare_flask_log_dir()
+        webserver_config = self._config
         webserver_config_path = str(self._config_path)
         try:
-            current_webserver_config = self._flask_container.pull(webserver_config_path)
+            current_webserver_config = self._flask_container.pull(webserver_config_path).read()
         except PathError:
             current_webserver_config = None
-        self._flask_container.push(webserver_config_path, self._config)
-        if current_webserver_config == self._config:
+        config_digest = hashlib.sha256(webserver_config.encode("utf-8")).hexdigest()
+        validated_digests = self._get_validated_config_digests()
+        config_changed = current_webserver_config != webserver_config
+        # an unchanged config file only ends the reconcile if it has also passed the
+        # configuration check; the file is pushed before validation, so equality alone
+        # would let a previously rejected config slip through on the next reconcile
+        if not config_changed and config_digest in validated_digests:
             return
-        exec_process = self._flask_container.exec(
-            self._check_config_command, environment=flask_environment
-        )
-        try:
-            exec_process.wait_output()
-        except ExecError as exc:
-            logger.error(
-                "webserver configuration check failed, stdout: %s, stderr: %s",
-                exc.stdout,
-                exc.stderr,
+        if config_changed:
+            self._flask_container.push(webserver_config_path, webserver_config)
+        if config_digest not in validated_digests:
+            exec_process = self._flask_container.exec(
+                self._check_config_command, environment=flask_environment
             )
-            raise CharmConfigInvalidError(
-                "Webserver configuration check failed, "
-                "please review your charm configuration or database relation"
-            ) from exc
+            try:
+                exec_process.wait_output()
+            except ExecError as exc:
+                logger.error(
+                    "webserver configuration check failed, stdout: %s, stderr: %s",
+                    exc.stdout,
+                    exc.stderr,
+                )
+                raise CharmConfigInvalidError(
+                    "Webserver configuration check failed, "
+                    "please review your charm configuration or database relation"
+                ) from exc
+            self._record_validated_config_digest(config_digest)
         if is_webserver_running:
             logger.info("gunicorn config changed, reloading")
             self._flask_container.send_signal(self._reload_signal, FLASK_SERVICE_NAME)
 
+    def _get_validated_config_digests(self) -> set[str]:
+        """Get the digests of configurations already validated in the current container.
+
+        Returns:
+            The digests of webserver configurations that have passed the configuration check.
+        """
+        try:
+            pulled = self._flask_container.pull(self._VALIDATED_CONFIG_FILE)
+            return set(typing.cast(str, pulled.read()).split())
+        except PathError:
+            return set()
+
+    def _record_validated_config_digest(self, config_digest: str) -> None:
+        """Record a configuration digest as validated in the current container.
+
+        Args:
+            config_digest: The digest of a webserver configuration that passed the check.
+        """
+        digests = self._get_validated_config_digests()
+        digests.add(config_digest)
+        self._flask_container.push(
+            self._VALIDATED_CONFIG_FILE, "\n".join(sorted(digests)), make_dirs=True
+        )
+
     def _prepare_flask_log_dir(self) -> None:
         """Prepare Flask access and error log directory for the Flask application."""
         container = self._flask_container
-        for log in (self._charm_state.flask_access_log, self._charm_state.flask_error_log):
-            log_dir = str(log.parent.absolute())
-            if not container.isdir(log_dir):
-                container.make_dir(log_dir, make_parents=True)
+        log_dirs = {os.path.dirname(log) for log in (self._access_log_str, self._error_log_str)}
+        for log_dir in log_dirs - self._prepared_log_dirs:
+            # make_dir with make_parents=True is a no-op when the directory exists,
+            # so no isdir probe is needed
+            container.make_dir(log_dir, make_parents=True)
+            self._prepared_log_dirs.add(log_dir)
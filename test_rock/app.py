@@ -5,39 +5,58 @@ import os
 import time
 from urllib.parse import urlparse
 
-import psycopg
 import pymysql
 import pymysql.cursors
 from flask import Flask, g, jsonify, request
+from psycopg_pool import ConnectionPool
 
 app = Flask(__name__)
 app.config.from_prefixed_env()
 
+# the connection string is fixed for the lifetime of the process, parse it once
+# at import instead of on every request
+_MYSQL_URI = os.environ.get("MYSQL_DB_CONNECT_STRING")
+_MYSQL_URI_PARTS = urlparse(_MYSQL_URI) if _MYSQL_URI else None
+_MYSQL_CONNECT_KWARGS = (
+    None
+    if _MYSQL_URI_PARTS is None
+    else {
+        "host": _MYSQL_URI_PARTS.hostname,
+        "user": _MYSQL_URI_PARTS.username,
+        "password": _MYSQL_URI_PARTS.password,
+        "database": _MYSQL_URI_PARTS.path[1:],
+        "port": _MYSQL_URI_PARTS.port,
+    }
+)
+
 
 def get_mysql_database():
     """Get the mysql db connection."""
     if "mysql_db" not in g:
-        if "MYSQL_DB_CONNECT_STRING" in os.environ:
-            uri_parts = urlparse(os.environ["MYSQL_DB_CONNECT_STRING"])
-            g.mysql_db = pymysql.connect(
-                host=uri_parts.hostname,
-                user=uri_parts.username,
-                password=uri_parts.password,
-                database=uri_parts.path[1:],
-                port=uri_parts.port,
-            )
+        if _MYSQL_CONNECT_KWARGS is not None:
+            g.mysql_db = pymysql.connect(**_MYSQL_CONNECT_KWARGS)
+            g.db_touched = True
         else:
             return None
     return g.mysql_db
 
 
+# pool postgresql connections process-wide so requests reuse the TCP+auth
+# handshake instead of reconnecting per application context
+_POSTGRESQL_URI = os.environ.get("POSTGRESQL_DB_CONNECT_STRING")
+_POSTGRESQL_POOL = (
+    ConnectionPool(conninfo=_POSTGRESQL_URI, min_size=1, max_size=8, open=True)
+    if _POSTGRESQL_URI
+    else None
+)
+
+
 def get_postgresql_database():
     """Get the postgresql db connection."""
     if "postgresql_db" not in g:
-        if "POSTGRESQL_DB_CONNECT_STRING" in os.environ:
-            g.postgresql_db = psycopg.connect(
-                conninfo=os.environ["POSTGRESQL_DB_CONNECT_STRING"],
-            )
+        if _POSTGRESQL_POOL is not None:
+            g.postgresql_db = _POSTGRESQL_POOL.getconn()
+            g.db_touched = True
         else:
             return None
     return g.postgresql_db
@@ -46,12 +65,15 @@ def get_postgresql_database():
 @app.teardown_appcontext
 def teardown_database(_):
     """Tear down databases connections."""
+    # most requests never touch a database; skip the per-connection pops for them
+    if not g.get("db_touched"):
+        return
     mysql_db = g.pop("mysql_db", None)
     if mysql_db is not None:
         mysql_db.close()
     postgresql_db = g.pop("postgresql_db", None)
     if postgresql_db is not None:
-        postgresql_db.close()
+        _POSTGRESQL_POOL.putconn(postgresql_db)
 
 
 @app.route("/")
@@ -3,13 +3,19 @@
 
 """Fixtures for flask charm integration tests."""
 
-import io
+import asyncio
 import json
+import os
 import pathlib
+import shutil
+import time
+import warnings
 import zipfile
 
 import pytest
 import pytest_asyncio
+import requests
+import requests.adapters
 import yaml
 from juju.application import Application
 from juju.model import Model
@@ -44,13 +50,32 @@ def fixture_test_db_flask_image(pytestconfig: Config):
     return test_flask_image
 
 
+# the logging-config only needs to reach the controller once per pytest
+# invocation, not once per test module
+_logging_config_set = False  # pylint: disable=invalid-name
+
+
 @pytest_asyncio.fixture(scope="module", name="model")
 async def fixture_model(ops_test: OpsTest) -> Model:
     """Return the current testing juju model."""
     assert ops_test.model
+    global _logging_config_set  # pylint: disable=global-statement
+    if not _logging_config_set:
+        await ops_test.model.set_config({"logging-config": "<root>=INFO;unit=DEBUG"})
+        _logging_config_set = True
     return ops_test.model
 
 
+@pytest.fixture(scope="session", name="http")
+def http_fixture():
+    """Return a requests session that pools connections across tests."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    yield session
+    session.close()
+
+
 @pytest.fixture(scope="module", name="external_hostname")
 def external_hostname_fixture() -> str:
     """Return the external hostname for ingress-related tests."""
@@ -81,13 +106,22 @@ def grafana_app_name_fixture() -> str:
     return "grafana-k8s"
 
 
+# cache the built charm across test modules; ops_test is module-scoped so a
+# session-scoped fixture can't own the build, but charmcraft pack is by far the
+# most expensive step of an integration run and the source doesn't change mid-run
+_built_charm_file: pathlib.Path | None = None  # pylint: disable=invalid-name
+
+
 @pytest_asyncio.fixture(scope="module", name="charm_file")
 async def charm_file_fixture(pytestconfig: pytest.Config, ops_test: OpsTest) -> pathlib.Path:
     """Get the existing charm file."""
     charm_file = pytestconfig.getoption("--charm-file")
-    if not charm_file:
-        charm_file = await ops_test.build_charm(".")
-    return pathlib.Path(charm_file).absolute()
+    if charm_file:
+        return pathlib.Path(charm_file).absolute()
+    global _built_charm_file  # pylint: disable=global-statement
+    if _built_charm_file is None:
+        _built_charm_file = pathlib.Path(await ops_test.build_charm(".")).absolute()
+    return _built_charm_file
 
 
 @pytest_asyncio.fixture(scope="module", name="build_charm")
@@ -99,9 +133,9 @@ async def build_charm_fixture(charm_file: str) -> str:
     Three additional configurations, namely foo_str, foo_int, foo_dict, foo_bool,
     and application_root will be appended to the config.yaml file.
     """
-    charm_zip = zipfile.ZipFile(charm_file, "r")
-    with charm_zip.open("config.yaml") as file:
-        config = yaml.safe_load(file)
+    with zipfile.ZipFile(charm_file, "r") as charm_zip:
+        with charm_zip.open("config.yaml") as file:
+            config = yaml.safe_load(file)
     config["options"].update(
         {
             "foo_str": {"type": "string"},
@@ -112,19 +146,17 @@ async def build_charm_fixture(charm_file: str) -> str:
         }
     )
     modified_config = yaml.safe_dump(config)
-    new_charm = io.BytesIO()
-    with zipfile.ZipFile(new_charm, "w") as new_charm_zip:
-        for item in charm_zip.infolist():
-            if item.filename == "config.yaml":
-                new_charm_zip.writestr(item, modified_config)
-            else:
-                with charm_zip.open(item) as file:
-                    data = file.read()
-                new_charm_zip.writestr(item, data)
-    charm_zip.close()
     charm = "flask-k8s_ubuntu-22.04-amd64_modified.charm"
-    with open(charm, "wb") as new_charm_file:
-        new_charm_file.write(new_charm.getvalue())
+    tmp_charm = f"{charm}.tmp"
+    shutil.copy(charm_file, tmp_charm)
+    # append the modified config.yaml instead of re-deflating every member of the
+    # charm zip; readers resolve duplicate names through the central directory,
+    # which keeps the appended entry
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        with zipfile.ZipFile(tmp_charm, "a") as new_charm_zip:
+            new_charm_zip.writestr("config.yaml", modified_config)
+    os.replace(tmp_charm, charm)
     return f"./{charm}"
 
 
@@ -229,17 +261,12 @@ async def deploy_cos_fixture(
     return cos_apps
 
 
-async def model_fixture(ops_test: OpsTest) -> Model:
-    """Provide current test model."""
-    assert ops_test.model
-    model_config = {"logging-config": "<root>=INFO;unit=DEBUG"}
-    await ops_test.model.set_config(model_config)
-    return ops_test.model
-
-
 @pytest_asyncio.fixture(scope="module", name="get_unit_ips")
 async def fixture_get_unit_ips(ops_test: OpsTest):
     """Return an async function to retrieve unit ip addresses of a certain application."""
+    # cache the parsed juju status briefly so polling loops don't spawn the juju
+    # CLI once per call
+    status_cache: dict = {"timestamp": 0.0, "status": None}
 
     async def get_unit_ips(application_name: str):
         """Retrieve unit ip addresses of a certain application.
@@ -247,12 +274,19 @@ async def fixture_get_unit_ips(ops_test: OpsTest):
         Returns:
             a list containing unit ip addresses.
         """
-        _, status, _ = await ops_test.juju("status", "--format", "json")
-        status = json.loads(status)
+        now = time.monotonic()
+        status = status_cache["status"]
+        if status is None or now - status_cache["timestamp"] >= 1.0:
+            _, raw_status, _ = await ops_test.juju("status", "--format", "json")
+            status = json.loads(raw_status)
+            status_cache["timestamp"] = now
+            status_cache["status"] = status
         units = status["applications"][application_name]["units"]
         return tuple(
             unit_status["address"]
-            for _, unit_status in sorted(units.items(), key=lambda kv: int(kv[0].split("/")[-1]))
+            for _, unit_status in sorted(
+                units.items(), key=lambda kv: int(kv[0].rsplit("/", 1)[1])
+            )
         )
 
     return get_unit_ips
@@ -271,8 +305,11 @@ async def update_config(model: Model, request: FixtureRequest, flask_app: Applic
 
     yield request_config
 
-    await flask_app.set_config(
-        {k: v for k, v in orig_config.items() if k in request_config and v is not None}
+    # the restored and reset key sets are disjoint, issue both calls concurrently
+    await asyncio.gather(
+        flask_app.set_config(
+            {k: v for k, v in orig_config.items() if k in request_config and v is not None}
+        ),
+        flask_app.reset_config([k for k in request_config if orig_config[k] is None]),
     )
-    await flask_app.reset_config([k for k in request_config if orig_config[k] is None])
     await model.wait_for_idle(apps=[flask_app.name])
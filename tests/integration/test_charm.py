@@ -4,6 +4,7 @@
 
 """Integration tests for Flask charm."""
 
+import asyncio
 import json
 import logging
 import typing
@@ -23,6 +24,7 @@ logger = logging.getLogger(__name__)
 
 async def test_flask_is_up(
     flask_app: Application,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
     """
@@ -30,8 +32,11 @@ async def test_flask_is_up(
     act: send a request to the flask application managed by the flask charm.
     assert: the flask application should return a correct response.
     """
-    for unit_ip in await get_unit_ips(flask_app.name):
-        response = requests.get(f"http://{unit_ip}:8000", timeout=5)
+    unit_ips = await get_unit_ips(flask_app.name)
+    responses = await asyncio.gather(
+        *(asyncio.to_thread(http.get, f"http://{unit_ip}:8000", timeout=5) for unit_ip in unit_ips)
+    )
+    for response in responses:
         assert response.status_code == 200
         assert "Hello, World!" in response.text
 
@@ -48,6 +53,7 @@ async def test_flask_is_up(
 @pytest.mark.usefixtures("update_config")
 async def test_flask_webserver_timeout(
     flask_app: Application,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
     timeout: int,
 ):
@@ -58,17 +64,16 @@ async def test_flask_webserver_timeout(
     """
     safety_timeout = timeout + 3
     for unit_ip in await get_unit_ips(flask_app.name):
-        assert requests.get(
+        assert http.get(
             f"http://{unit_ip}:8000/sleep?duration={timeout - 1}", timeout=safety_timeout
         ).ok
         with pytest.raises(requests.ConnectionError):
-            requests.get(
-                f"http://{unit_ip}:8000/sleep?duration={timeout + 1}", timeout=safety_timeout
-            )
+            http.get(f"http://{unit_ip}:8000/sleep?duration={timeout + 1}", timeout=safety_timeout)
 
 
 async def test_default_secret_key(
     flask_app: Application,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
     """
@@ -76,10 +81,13 @@ async def test_default_secret_key(
     act: query flask secret key from the Flask server.
     assert: flask should have a default and secure secret configured.
     """
-    secret_keys = [
-        requests.get(f"http://{unit_ip}:8000/config/SECRET_KEY", timeout=10).json()
-        for unit_ip in await get_unit_ips(flask_app.name)
-    ]
+    responses = await asyncio.gather(
+        *(
+            asyncio.to_thread(http.get, f"http://{unit_ip}:8000/config/SECRET_KEY", timeout=10)
+            for unit_ip in await get_unit_ips(flask_app.name)
+        )
+    )
+    secret_keys = [response.json() for response in responses]
     assert len(set(secret_keys)) == 1
     assert len(secret_keys[0]) > 10
 
@@ -101,6 +109,7 @@ async def test_default_secret_key(
 @pytest.mark.usefixtures("update_config")
 async def test_flask_config(
     flask_app: Application,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
     excepted_config: dict,
 ):
@@ -109,12 +118,19 @@ async def test_flask_config(
     act: query flask configurations from the Flask server.
     assert: the flask configuration should match flask related charm configurations.
     """
+    expected_values = []
+    probes = []
     for unit_ip in await get_unit_ips(flask_app.name):
         for config_key, config_value in excepted_config.items():
-            assert (
-                requests.get(f"http://{unit_ip}:8000/config/{config_key}", timeout=10).json()
-                == config_value
+            probes.append(
+                asyncio.to_thread(
+                    http.get, f"http://{unit_ip}:8000/config/{config_key}", timeout=10
+                )
             )
+            expected_values.append(config_value)
+    responses = await asyncio.gather(*probes)
+    for response, config_value in zip(responses, expected_values):
+        assert response.json() == config_value
 
 
 @pytest.mark.parametrize(
@@ -165,6 +181,7 @@ async def test_invalid_flask_config(flask_app: Application, invalid_configs: tup
 @pytest.mark.usefixtures("update_config")
 async def test_app_config(
     flask_app: Application,
+    http: requests.Session,
     excepted_config: dict[str, str | int | bool],
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
@@ -173,17 +190,25 @@ async def test_app_config(
     act: none.
     assert: Flask application should receive the application configuration correctly.
     """
+    expected_values = []
+    probes = []
     for unit_ip in await get_unit_ips(flask_app.name):
         for config_key, config_value in excepted_config.items():
-            assert (
-                requests.get(f"http://{unit_ip}:8000/config/{config_key}", timeout=10).json()
-                == config_value
+            probes.append(
+                asyncio.to_thread(
+                    http.get, f"http://{unit_ip}:8000/config/{config_key}", timeout=10
+                )
             )
+            expected_values.append(config_value)
+    responses = await asyncio.gather(*probes)
+    for response, config_value in zip(responses, expected_values):
+        assert response.json() == config_value
 
 
 async def test_rotate_secret_key(
     model: juju.model.Model,
     flask_app: Application,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
     """
@@ -192,16 +217,20 @@ async def test_rotate_secret_key(
     assert: Flask applications on every unit should have a new secret key configured.
     """
     unit_ips = await get_unit_ips(flask_app.name)
-    secret_key = requests.get(f"http://{unit_ips[0]}:8000/config/SECRET_KEY", timeout=10).json()
+    secret_key = http.get(f"http://{unit_ips[0]}:8000/config/SECRET_KEY", timeout=10).json()
     leader_unit = [u for u in flask_app.units if await u.is_leader_from_status()][0]
     action = await leader_unit.run_action("rotate-secret-key")
     await action.wait()
     assert action.results["status"] == "success"
     await model.wait_for_idle(status=ops.ActiveStatus.name)  # type: ignore
-    for unit_ip in unit_ips:
-        new_secret_key = requests.get(
-            f"http://{unit_ip}:8000/config/SECRET_KEY", timeout=10
-        ).json()
+    responses = await asyncio.gather(
+        *(
+            asyncio.to_thread(http.get, f"http://{unit_ip}:8000/config/SECRET_KEY", timeout=10)
+            for unit_ip in unit_ips
+        )
+    )
+    for response in responses:
+        new_secret_key = response.json()
         assert len(new_secret_key) > 10
         assert new_secret_key != secret_key
 
@@ -213,6 +242,7 @@ async def test_with_ingress(
     traefik_app,  # pylint: disable=unused-argument
     traefik_app_name: str,
     external_hostname: str,
+    http: requests.Session,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
     """
@@ -225,7 +255,7 @@ async def test_with_ingress(
     await model.wait_for_idle(status=ops.ActiveStatus.name)  # type: ignore
 
     traefik_ip = (await get_unit_ips(traefik_app_name))[0]
-    response = requests.get(
+    response = http.get(
         f"http://{traefik_ip}",
         headers={"Host": f"{ops_test.model_name}-{flask_app.name}.{external_hostname}"},
         timeout=5,
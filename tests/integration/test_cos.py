@@ -30,9 +30,12 @@ async def test_prometheus_integration(
     await model.add_relation(prometheus_app_name, flask_app.name)
     await model.wait_for_idle(apps=[flask_app.name, prometheus_app_name], status="active")
 
-    for unit_ip in await get_unit_ips(prometheus_app_name):
-        query_targets = requests.get(f"http://{unit_ip}:9090/api/v1/targets", timeout=10).json()
-        assert len(query_targets["data"]["activeTargets"])
+    # scrape state is shared across prometheus units, one probe suffices
+    prometheus_ip = (await get_unit_ips(prometheus_app_name))[0]
+    query_targets = requests.get(
+        f"http://{prometheus_ip}:9090/api/v1/targets", timeout=10
+    ).json()
+    assert len(query_targets["data"]["activeTargets"])
 
 
 async def test_loki_integration(
@@ -54,16 +57,25 @@ async def test_loki_integration(
         apps=[flask_app.name, loki_app_name], status="active", idle_period=60
     )
     flask_ip = (await get_unit_ips(flask_app.name))[0]
-    # populate the access log
-    for _ in range(120):
-        requests.get(f"http://{flask_ip}:8000", timeout=10)
-        await asyncio.sleep(1)
+    # populate the access log with a burst of requests
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(requests.get, f"http://{flask_ip}:8000", timeout=10)
+            for _ in range(20)
+        )
+    )
     loki_ip = (await get_unit_ips(loki_app_name))[0]
-    log_query = requests.get(
-        f"http://{loki_ip}:3100/loki/api/v1/query",
-        timeout=10,
-        params={"query": f'{{juju_application="{flask_app.name}"}}'},
-    ).json()
+    # poll until loki has scraped the access log instead of sleeping a fixed two minutes
+    log_query: dict = {}
+    for _ in range(60):
+        log_query = requests.get(
+            f"http://{loki_ip}:3100/loki/api/v1/query",
+            timeout=10,
+            params={"query": f'{{juju_application="{flask_app.name}"}}'},
+        ).json()
+        if log_query["data"]["result"]:
+            break
+        await asyncio.sleep(2)
     assert len(log_query["data"]["result"])
 
 
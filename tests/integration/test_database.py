@@ -3,6 +3,7 @@
 # See LICENSE file for licensing details.
 
 """Integration tests for Flask charm database integration."""
+import asyncio
 import logging
 
 import juju
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 async def test_with_database(
     ops_test: OpsTest,
     flask_app: Application,
+    http: requests.Session,
     model: juju.model.Model,
     get_unit_ips,
     endpoint: str,
@@ -47,15 +49,21 @@ async def test_with_database(
     if trust:
         deploy_cmd.extend(["--trust"])
     await ops_test.juju(*deploy_cmd)
-    # mypy doesn't see that ActiveStatus has a name
-    await model.wait_for_idle(status=ops.ActiveStatus.name)  # type: ignore
-
-    await model.add_relation(flask_app.name, db_name)
+    # queue the relation while the database is still settling; juju converges once
+    await asyncio.gather(
+        model.wait_for_idle(apps=[db_name]),
+        model.add_relation(flask_app.name, db_name),
+    )
 
     # mypy doesn't see that ActiveStatus has a name
     await model.wait_for_idle(status=ops.ActiveStatus.name)  # type: ignore
 
-    for unit_ip in await get_unit_ips(flask_app.name):
-        response = requests.get(f"http://{unit_ip}:8000/{endpoint}", timeout=5)
+    responses = await asyncio.gather(
+        *(
+            asyncio.to_thread(http.get, f"http://{unit_ip}:8000/{endpoint}", timeout=5)
+            for unit_ip in await get_unit_ips(flask_app.name)
+        )
+    )
+    for response in responses:
         assert response.status_code == 200
         assert "SUCCESS" == response.text
@@ -3,6 +3,7 @@
 
 """Integration tests for flask-k8s charm default image."""
 
+import asyncio
 import typing
 
 import requests
@@ -12,6 +13,7 @@ from juju.model import Model
 async def test_default_image(
     model: Model,
     flask_app_image: str,
+    http: requests.Session,
     charm_file: str,
     get_unit_ips: typing.Callable[[str], typing.Awaitable[tuple[str, ...]]],
 ):
@@ -27,7 +29,12 @@ async def test_default_image(
     app_name = "flask-sentinel"
     await model.deploy(charm_file, resources=resources, application_name=app_name, series="jammy")
     await model.wait_for_idle(apps=[app_name], raise_on_blocked=True)
-    for unit_ip in await get_unit_ips(app_name):
-        resp = requests.get(f"http://{unit_ip}:8000", timeout=10)
+    responses = await asyncio.gather(
+        *(
+            asyncio.to_thread(http.get, f"http://{unit_ip}:8000", timeout=10)
+            for unit_ip in await get_unit_ips(app_name)
+        )
+    )
+    for resp in responses:
         assert resp.ok
         assert "Welcome to flask-k8s Charm" in resp.text
@@ -4,11 +4,19 @@
 
 """Integration tests for Flask charm proxy setting."""
 
+import asyncio
+
 import requests
 from juju.model import Model
 
 
-async def test_proxy(build_charm: str, model: Model, test_flask_image: str, get_unit_ips):
+async def test_proxy(
+    build_charm: str,
+    model: Model,
+    test_flask_image: str,
+    http: requests.Session,
+    get_unit_ips,
+):
     """Build and deploy the flask charm."""
     app_name = "flask-k8s"
     http_proxy = "http://proxy.test"
@@ -29,8 +37,13 @@ async def test_proxy(build_charm: str, model: Model, test_flask_image: str, get_
     await model.deploy(build_charm, resources=resources, application_name=app_name, series="jammy")
     await model.wait_for_idle(raise_on_blocked=True)
     unit_ips = await get_unit_ips(app_name)
-    for unit_ip in unit_ips:
-        response = requests.get(f"http://{unit_ip}:8000/env", timeout=5)
+    responses = await asyncio.gather(
+        *(
+            asyncio.to_thread(http.get, f"http://{unit_ip}:8000/env", timeout=5)
+            for unit_ip in unit_ips
+        )
+    )
+    for response in responses:
         assert response.status_code == 200
         env = response.json()
         assert env["http_proxy"] == http_proxy
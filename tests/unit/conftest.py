@@ -5,22 +5,47 @@
 
 # pylint: disable=protected-access,too-few-public-methods
 
+import pathlib
 import typing
 import unittest.mock
 
 import ops
 import pytest
+import yaml
 from ops.testing import Harness
 
 from charm import FlaskCharm
 from constants import FLASK_CONTAINER_NAME
 from database_migration import DatabaseMigrationStatus
 
+# read the charm metadata once instead of letting every Harness construction
+# re-discover and re-read the files
+_METADATA_YAML = pathlib.Path("metadata.yaml").read_text(encoding="utf-8")
+_CONFIG_YAML = pathlib.Path("config.yaml").read_text(encoding="utf-8")
+
+_CHECK_CONFIG_COMMAND = [
+    "python3",
+    "-m",
+    "gunicorn",
+    "-c",
+    "/flask/gunicorn.conf.py",
+    "app:app",
+    "--check-config",
+]
+
+
+@pytest.fixture(scope="session", name="config_yaml")
+def config_yaml_fixture() -> dict:
+    """Parse the charm config.yaml once for the whole test session."""
+    # libyaml's CSafeLoader parses a few times faster than the pure-Python loader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(_CONFIG_YAML, Loader=loader)
+
 
 @pytest.fixture(name="harness")
 def harness_fixture() -> typing.Generator[Harness, None, None]:
     """Ops testing framework harness fixture."""
-    harness = Harness(FlaskCharm)
+    harness = Harness(FlaskCharm, meta=_METADATA_YAML, config=_CONFIG_YAML)
     harness.set_leader()
     root = harness.get_filesystem_root(FLASK_CONTAINER_NAME)
     (root / "flask/app").mkdir(parents=True)
@@ -33,28 +58,23 @@ def harness_fixture() -> typing.Generator[Harness, None, None]:
             return ops.testing.ExecResult(0)
         return ops.testing.ExecResult(1)
 
-    harness.handle_exec(
-        FLASK_CONTAINER_NAME,
-        [
-            "python3",
-            "-m",
-            "gunicorn",
-            "-c",
-            "/flask/gunicorn.conf.py",
-            "app:app",
-            "--check-config",
-        ],
-        handler=check_config_handler,
-    )
+    harness.handle_exec(FLASK_CONTAINER_NAME, _CHECK_CONFIG_COMMAND, handler=check_config_handler)
 
     yield harness
     harness.cleanup()
 
 
+@pytest.fixture(scope="session", name="_database_migration_shared_mock")
+def database_migration_shared_mock_fixture():
+    """Create the shared mock instance for the DatabaseMigration class."""
+    return unittest.mock.MagicMock()
+
+
 @pytest.fixture
-def database_migration_mock():
-    """Create a mock instance for the DatabaseMigration class."""
-    mock = unittest.mock.MagicMock()
+def database_migration_mock(_database_migration_shared_mock):
+    """Provide a reset mock instance for the DatabaseMigration class."""
+    mock = _database_migration_shared_mock
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.status = DatabaseMigrationStatus.PENDING
     mock.script = None
     return mock
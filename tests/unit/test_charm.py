@@ -6,14 +6,15 @@
 # this is a unit test file
 # pylint: disable=protected-access
 
-import unittest.mock
+import types
+import typing
 
-import yaml
 from ops.testing import Harness
 
 from charm_state import KNOWN_CHARM_CONFIG, CharmState
 from constants import FLASK_CONTAINER_NAME, FLASK_SERVICE_NAME
 from flask_app import FlaskApp
+from secret_storage import SecretStorage
 from webserver import GunicornWebserver
 
 FLASK_BASE_DIR = "/flask"
@@ -26,10 +27,11 @@ def test_flask_pebble_layer(harness: Harness) -> None:
     assert: flask charm should submit the correct flaks pebble layer to pebble.
     """
     harness.begin()
-    secret_storage = unittest.mock.MagicMock()
-    secret_storage.is_initialized = True
     test_key = "0" * 16
-    secret_storage.get_flask_secret_key.return_value = test_key
+    secret_storage = typing.cast(
+        SecretStorage,
+        types.SimpleNamespace(is_initialized=True, get_flask_secret_key=lambda: test_key),
+    )
     charm_state = CharmState.from_charm(
         charm=harness.charm, secret_storage=secret_storage, database_uris={}
     )
@@ -55,15 +57,13 @@ def test_flask_pebble_layer(harness: Harness) -> None:
     }
 
 
-def test_known_charm_config():
+def test_known_charm_config(config_yaml: dict):
     """
     arrange: none
     act: none
     assert: KNOWN_CHARM_CONFIG in the consts module matches the content of config.yaml file.
     """
-    with open("config.yaml", encoding="utf-8") as config_file:
-        config = yaml.safe_load(config_file)
-    assert sorted(config["options"].keys()) == sorted(KNOWN_CHARM_CONFIG)
+    assert sorted(config_yaml["options"].keys()) == sorted(KNOWN_CHARM_CONFIG)
 
 
 def test_rotate_secret_key_action(harness: Harness):
@@ -74,7 +74,7 @@ def test_rotate_secret_key_action(harness: Harness):
         flask application with the new secret key.
     """
     harness.begin_with_initial_hooks()
-    action_event = unittest.mock.MagicMock()
+    action_event = types.SimpleNamespace(set_results=lambda _: None, fail=lambda _: None)
     secret_key = harness.get_relation_data(0, harness.charm.app)["flask_secret_key"]
     assert secret_key
     harness.charm._on_rotate_secret_key_action(action_event)
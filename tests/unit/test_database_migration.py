@@ -3,6 +3,8 @@
 
 """Unit tests for Flask charm database integration."""
 
+import types
+
 import ops
 import pytest
 from ops.testing import Harness
@@ -15,16 +17,11 @@ from flask_app import FlaskApp
 from webserver import GunicornWebserver
 
 
-def test_database_migration(harness: Harness):
-    """
-    arrange: none
-    act: set the database migration script to be different value.
-    assert: the restart_flask method will not invoke the database migration script after the
-        first successful run.
-    """
+@pytest.fixture(name="migration_stack")
+def migration_stack_fixture(harness: Harness) -> types.SimpleNamespace:
+    """Build the container, charm state and Flask app shared by the migration tests."""
     harness.begin()
     container: ops.Container = harness.model.unit.get_container(FLASK_CONTAINER_NAME)
-    root = harness.get_filesystem_root(FLASK_CONTAINER_NAME)
     harness.set_can_connect(FLASK_CONTAINER_NAME, True)
     charm_state = CharmState(
         flask_secret_key="abc",
@@ -42,13 +39,32 @@ def test_database_migration(harness: Harness):
         webserver=webserver,
         database_migration=database_migration,
     )
+    return types.SimpleNamespace(
+        container=container,
+        charm_state=charm_state,
+        webserver=webserver,
+        database_migration=database_migration,
+        flask_app=flask_app,
+    )
+
+
+def test_database_migration(harness: Harness, migration_stack: types.SimpleNamespace):
+    """
+    arrange: none
+    act: set the database migration script to be different value.
+    assert: the restart_flask method will not invoke the database migration script after the
+        first successful run.
+    """
+    charm_state = migration_stack.charm_state
+    flask_app = migration_stack.flask_app
     database_migration_history = []
+    existing_scripts = set()
 
     def handle_database_migration(args: ops.testing.ExecArgs):
         """Handle the database migration command."""
         script = args.command[-1]
         database_migration_history.append(script)
-        if (root / script.removeprefix("/")).exists():
+        if script in existing_scripts:
             return ops.testing.ExecResult(0)
         return ops.testing.ExecResult(1)
 
@@ -59,7 +75,7 @@ def test_database_migration(harness: Harness):
         flask_app.restart_flask()
     assert database_migration_history == ["/flask/app/database-migration.sh"]
 
-    (root / "flask/app/database-migration.sh").touch()
+    existing_scripts.add("/flask/app/database-migration.sh")
     flask_app.restart_flask()
     assert database_migration_history == ["/flask/app/database-migration.sh"] * 2
 
@@ -67,39 +83,22 @@ def test_database_migration(harness: Harness):
     flask_app = FlaskApp(
         charm=harness.charm,
         charm_state=charm_state,
-        webserver=webserver,
-        database_migration=database_migration,
+        webserver=migration_stack.webserver,
+        database_migration=migration_stack.database_migration,
     )
     with pytest.raises(CharmConfigInvalidError):
         flask_app.restart_flask()
     assert database_migration_history == ["/flask/app/database-migration.sh"] * 2
 
 
-def test_database_migration_rerun(harness: Harness):
+def test_database_migration_rerun(harness: Harness, migration_stack: types.SimpleNamespace):
     """
     arrange: none
     act: fail the first database migration run and rerun database migration.
     assert: the second database migration run should be successfully.
     """
-    harness.begin()
-    container: ops.Container = harness.model.unit.get_container(FLASK_CONTAINER_NAME)
-    harness.set_can_connect(FLASK_CONTAINER_NAME, True)
-    charm_state = CharmState(
-        flask_secret_key="abc",
-        is_secret_storage_ready=True,
-        database_migration_script="/flask/app/database-migration.sh",
-    )
-    webserver = GunicornWebserver(
-        charm_state=charm_state,
-        flask_container=container,
-    )
-    database_migration = DatabaseMigration(flask_container=container, charm_state=charm_state)
-    flask_app = FlaskApp(
-        charm=harness.charm,
-        charm_state=charm_state,
-        database_migration=database_migration,
-        webserver=webserver,
-    )
+    database_migration = migration_stack.database_migration
+    flask_app = migration_stack.flask_app
     harness.handle_exec(FLASK_CONTAINER_NAME, ["/bin/bash", "-xeo", "pipefail"], result=1)
     with pytest.raises(CharmConfigInvalidError):
         flask_app.restart_flask()
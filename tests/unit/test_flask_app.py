@@ -6,6 +6,9 @@
 # this is a unit test file
 # pylint: disable=protected-access
 
+# caused by pytest fixtures
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+
 import json
 import typing
 import unittest.mock
@@ -17,29 +20,57 @@ from constants import FLASK_ENV_CONFIG_PREFIX
 from flask_app import FlaskApp
 
 
+@pytest.fixture(scope="session", name="charm_mock")
+def charm_mock_fixture():
+    """Provide a placeholder charm mock shared by all parametrize cases."""
+    return unittest.mock.MagicMock()
+
+
+@pytest.fixture(scope="session", name="webserver_mock")
+def webserver_mock_fixture():
+    """Provide a placeholder webserver mock shared by all parametrize cases."""
+    return unittest.mock.MagicMock()
+
+
+@pytest.fixture(scope="module", name="charm_state")
+def charm_state_fixture(request):
+    """Build a CharmState with the parametrized flask_config, shared per unique config."""
+    return CharmState(
+        flask_secret_key="foobar",
+        is_secret_storage_ready=True,
+        flask_config=request.param,
+    )
+
+
 @pytest.mark.parametrize(
-    "flask_config",
+    "charm_state, flask_config",
     [
-        pytest.param({"env": "test"}, id="env"),
-        pytest.param({"permanent_session_lifetime": 1}, id="permanent_session_lifetime"),
-        pytest.param({"debug": True}, id="debug"),
+        pytest.param({"env": "test"}, {"env": "test"}, id="env"),
+        pytest.param(
+            {"permanent_session_lifetime": 1},
+            {"permanent_session_lifetime": 1},
+            id="permanent_session_lifetime",
+        ),
+        pytest.param({"debug": True}, {"debug": True}, id="debug"),
     ],
+    indirect=["charm_state"],
 )
-def test_flask_env(flask_config: dict, database_migration_mock):
+def test_flask_env(
+    charm_state: CharmState,
+    flask_config: dict,
+    database_migration_mock,
+    charm_mock,
+    webserver_mock,
+):
     """
     arrange: create the Flask app object with a controlled charm state.
     act: none.
     assert: flask_environment generated by the Flask app object should be acceptable by Flask app.
     """
-    charm_state = CharmState(
-        flask_secret_key="foobar",
-        is_secret_storage_ready=True,
-        flask_config=flask_config,
-    )
     flask_app = FlaskApp(
-        charm=unittest.mock.MagicMock(),
+        charm=charm_mock,
         charm_state=charm_state,
-        webserver=unittest.mock.MagicMock(),
+        webserver=webserver_mock,
         database_migration=database_migration_mock,
     )
     env = flask_app._flask_environment()
@@ -75,15 +106,19 @@ HTTP_PROXY_TEST_PARAMS = [
 ]
 
 
+@pytest.mark.parametrize("charm_state", [{}], indirect=True)
 @pytest.mark.parametrize(
     "set_env, expected",
     HTTP_PROXY_TEST_PARAMS,
 )
 def test_http_proxy(
+    charm_state: CharmState,
     set_env: typing.Dict[str, str],
     expected: typing.Dict[str, str],
     monkeypatch,
     database_migration_mock,
+    charm_mock,
+    webserver_mock,
 ):
     """
     arrange: set juju charm http proxy related environment variables.
@@ -92,15 +127,10 @@ def test_http_proxy(
     """
     for set_env_name, set_env_value in set_env.items():
         monkeypatch.setenv(set_env_name, set_env_value)
-    charm_state = CharmState(
-        flask_secret_key="",
-        is_secret_storage_ready=True,
-        flask_config={},
-    )
     flask_app = FlaskApp(
-        charm=unittest.mock.MagicMock(),
+        charm=charm_mock,
         charm_state=charm_state,
-        webserver=unittest.mock.MagicMock(),
+        webserver=webserver_mock,
         database_migration=database_migration_mock,
     )
     env = flask_app._flask_environment()
@@ -6,7 +6,6 @@
 # this is a unit test file
 # pylint: disable=protected-access
 
-import textwrap
 import unittest.mock
 
 import ops
@@ -15,36 +14,33 @@ from ops.testing import Harness
 
 from charm_state import CharmState
 from constants import FLASK_BASE_DIR, FLASK_CONTAINER_NAME
+from exceptions import CharmConfigInvalidError
 from flask_app import FlaskApp
 from webserver import GunicornWebserver
 
 GUNICORN_CONFIG_TEST_PARAMS = [
     pytest.param(
         {"webserver_workers": 10},
-        textwrap.dedent(
-            f"""\
-                bind = ['0.0.0.0:8000']
-                chdir = '{FLASK_BASE_DIR}/app'
-                accesslog = '/var/log/flask/access.log'
-                errorlog = '/var/log/flask/error.log'
-                statsd_host = 'localhost:9125'
-                workers = 10"""
-        ),
+        f"""\
+bind = ['0.0.0.0:8000']
+chdir = '{FLASK_BASE_DIR}/app'
+accesslog = '/var/log/flask/access.log'
+errorlog = '/var/log/flask/error.log'
+statsd_host = 'localhost:9125'
+workers = 10""",
         id="workers=10",
     ),
     pytest.param(
         {"webserver_threads": 2, "webserver_timeout": 3, "webserver_keepalive": 4},
-        textwrap.dedent(
-            f"""\
-                bind = ['0.0.0.0:8000']
-                chdir = '{FLASK_BASE_DIR}/app'
-                accesslog = '/var/log/flask/access.log'
-                errorlog = '/var/log/flask/error.log'
-                statsd_host = 'localhost:9125'
-                threads = 2
-                keepalive = 4
-                timeout = 3"""
-        ),
+        f"""\
+bind = ['0.0.0.0:8000']
+chdir = '{FLASK_BASE_DIR}/app'
+accesslog = '/var/log/flask/access.log'
+errorlog = '/var/log/flask/error.log'
+statsd_host = 'localhost:9125'
+threads = 2
+keepalive = 4
+timeout = 3""",
         id="threads=2,timeout=3,keepalive=4",
     ),
 ]
@@ -60,7 +56,7 @@ def test_gunicorn_config(
     act: invoke the update_config method of the webserver object.
     assert: gunicorn configuration file inside the flask app container should change accordingly.
     """
-    harness.begin_with_initial_hooks()
+    harness.begin()
     container: ops.Container = harness.model.unit.get_container(FLASK_CONTAINER_NAME)
     harness.set_can_connect(FLASK_CONTAINER_NAME, True)
     charm_state = CharmState(
@@ -85,15 +81,14 @@ def test_gunicorn_config(
 @pytest.mark.parametrize("is_running", [True, False])
 def test_webserver_reload(monkeypatch, harness: Harness, is_running, database_migration_mock):
     """
-    arrange: put an empty file in the Flask container and create a webserver object with default
-        charm state.
+    arrange: put a stale webserver config file in the Flask container and create a webserver
+        object with default charm state.
     act: run the update_config method of the webserver object with different server running status.
     assert: webserver object should send signal to the Gunicorn server based on the running status.
     """
-    harness.begin_with_initial_hooks()
+    harness.begin()
     container: ops.Container = harness.model.unit.get_container(FLASK_CONTAINER_NAME)
     harness.set_can_connect(FLASK_CONTAINER_NAME, True)
-    container.push(f"{FLASK_BASE_DIR}/gunicorn.conf.py", "")
     charm_state = CharmState(flask_secret_key="", is_secret_storage_ready=True)
     webserver = GunicornWebserver(
         charm_state=charm_state,
@@ -106,9 +101,28 @@ def test_webserver_reload(monkeypatch, harness: Harness, is_running, database_mi
         database_migration=database_migration_mock,
     )
     flask_app.restart_flask()
+    container.push(f"{FLASK_BASE_DIR}/gunicorn.conf.py", "")
     send_signal_mock = unittest.mock.MagicMock()
     monkeypatch.setattr(container, "send_signal", send_signal_mock)
     webserver.update_config(
         is_webserver_running=is_running, flask_environment=flask_app._flask_environment()
     )
     assert send_signal_mock.call_count == (1 if is_running else 0)
+
+
+def test_webserver_invalid_config_rechecked(harness: Harness):
+    """
+    arrange: create a webserver object whose webserver configuration check always fails.
+    act: run the update_config method of the webserver object twice.
+    assert: both runs should raise CharmConfigInvalidError, even though the rejected
+        configuration file is already inside the container after the first run.
+    """
+    harness.begin()
+    container: ops.Container = harness.model.unit.get_container(FLASK_CONTAINER_NAME)
+    harness.set_can_connect(FLASK_CONTAINER_NAME, True)
+    charm_state = CharmState(flask_secret_key="", is_secret_storage_ready=True)
+    webserver = GunicornWebserver(charm_state=charm_state, flask_container=container)
+    harness.handle_exec(FLASK_CONTAINER_NAME, webserver._check_config_command, result=1)
+    for _ in range(2):
+        with pytest.raises(CharmConfigInvalidError):
+            webserver.update_config(is_webserver_running=False, flask_environment={})